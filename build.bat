@@ -5,4 +5,5 @@ if not exist venv (
 )
 call venv\Scripts\activate
 pip install -r requirements.txt pyinstaller
-pyinstaller --noconfirm --onefile --windowed toolbox\main.py --name Toolbox
+REM Tools are imported lazily by the dashboard, so list them explicitly
+pyinstaller --noconfirm --onefile --windowed --paths toolbox --hidden-import pdf_annotator --hidden-import screenshot_tool --hidden-import converter toolbox\main.py --name Toolbox
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+import functools
+import multiprocessing
 import os
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Callable, Deque, Iterator
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
 try:
-    from PIL import Image
+    from PIL import Image, TiffImagePlugin
 except Exception as exc:  # pylint: disable=broad-except
     raise ImportError(
         "Pillow is required for the converter. Please install it before running."  # noqa: E501
@@ -20,6 +26,123 @@ except Exception as exc:  # pylint: disable=broad-except
         "PyMuPDF is required for the converter. Please install it before running."  # noqa: E501
     ) from exc
 
+# Called with (pages done, total pages) while a PDF is converted.
+ProgressCallback = Callable[[int, int], None]
+
+# Source formats that already lost detail; only these may be re-encoded lossy.
+LOSSY_FORMATS = {"JPEG", "MPO"}
+
+
+def _save_params(fmt: str, lossless: bool = True) -> dict:
+    """Encoder options for ``fmt``, favouring file size over save speed.
+
+    ``lossless`` selects lossless WebP. It is the default; lossy WebP is only
+    used for sources that were lossy to begin with, such as JPEG photos.
+    """
+    if fmt == "JPEG":
+        return {"quality": 85, "optimize": True, "progressive": True}
+    if fmt == "PNG":
+        return {"compress_level": 9}
+    if fmt == "WEBP":
+        if lossless:
+            return {"lossless": True, "method": 6}
+        return {"method": 4, "quality": 80}
+    if fmt == "TIFF":
+        return {"compression": "tiff_deflate"}
+    return {}
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_pipeline(fmt: str, mode: str | None, size: tuple[int, int] | None, dpi: int | None, lossless: bool = True) -> Callable[[Image.Image, str], None]:
+    """Return a function that converts, resizes and saves an image.
+
+    The options are resolved once so converting many pages or files does not
+    re-evaluate them each time. ``mode`` and ``size`` are skipped when None.
+    """
+    params = _save_params(fmt, lossless)
+    if dpi:
+        params["dpi"] = (dpi, dpi)
+    if mode and size:
+        def run(img: Image.Image, dst: str) -> None:
+            img.convert(mode).resize(size, Image.Resampling.LANCZOS).save(dst, format=fmt, **params)
+    elif mode:
+        def run(img: Image.Image, dst: str) -> None:
+            img.convert(mode).save(dst, format=fmt, **params)
+    elif size:
+        def run(img: Image.Image, dst: str) -> None:
+            img.resize(size, Image.Resampling.LANCZOS).save(dst, format=fmt, **params)
+    else:
+        def run(img: Image.Image, dst: str) -> None:
+            img.save(dst, format=fmt, **params)
+    return run
+
+
+def _render_page(src: str, page_no: int, dpi: int, gray: bool, size: tuple[int, int] | None) -> Image.Image:
+    """Rasterize a single PDF page.
+
+    Module level so it can be pickled into a worker process. Each call opens
+    its own document as ``fitz.Document`` objects cannot be shared.
+    """
+    colorspace = fitz.csGRAY if gray else fitz.csRGB
+    with fitz.open(src) as doc:
+        page = doc[page_no]
+        if size:
+            # Rasterize straight at the target size instead of resizing afterwards.
+            matrix = fitz.Matrix(size[0] / page.rect.width, size[1] / page.rect.height)
+            pix = page.get_pixmap(matrix=matrix, colorspace=colorspace)
+        else:
+            pix = page.get_pixmap(dpi=dpi, colorspace=colorspace)
+    if gray:
+        # Pillow can map single-channel data without copying it again.
+        img = Image.frombuffer("L", (pix.width, pix.height), pix.samples, "raw", "L", 0, 1)
+    else:
+        # "RGB" cannot be mapped; frombuffer would silently copy as well.
+        img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+    pix = None  # free the MuPDF buffer before any further processing
+    # Drop decoded fonts and images from MuPDF's global store so a worker's
+    # memory does not keep growing over a long document.
+    fitz.TOOLS.store_shrink(100)
+    if size and img.size != size:
+        img = img.resize(size, Image.Resampling.LANCZOS)
+    return img
+
+
+def _export_page(src: str, page_no: int, dst: str, fmt: str, dpi: int, gray: bool, size: tuple[int, int] | None) -> None:
+    """Rasterize a PDF page and write it straight to ``dst``."""
+    # Mode and size are already handled while rasterizing.
+    _compile_pipeline(fmt, None, None, None)(_render_page(src, page_no, dpi, gray, size), dst)
+
+
+def _max_workers(jobs: int) -> int:
+    return max(1, min(os.cpu_count() or 1, 4, jobs))
+
+
+class _InlineExecutor(Executor):
+    """Executor that runs jobs immediately in the calling thread.
+
+    Used when a process pool cannot parallelize anything, so a single page
+    or a single CPU does not pay for spawning and pickling.
+    """
+
+    def submit(self, fn, /, *args, **kwargs):  # type: ignore[override]
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as exc:  # pylint: disable=broad-except
+            future.set_exception(exc)
+        return future
+
+
+def _iter_pages(executor: Executor, workers: int, src: str, count: int, dpi: int, gray: bool, size: tuple[int, int] | None) -> Iterator[Image.Image]:
+    """Yield rendered pages in order, keeping only a few of them in flight."""
+    pending: Deque[Future[Image.Image]] = deque()
+    for page_no in range(count):
+        pending.append(executor.submit(_render_page, src, page_no, dpi, gray, size))
+        if len(pending) > workers:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
 
 class ConverterTool:
     """Window for converting images and PDFs to various formats."""
@@ -37,7 +160,7 @@ class ConverterTool:
         self.file_label.grid(row=0, column=1, columnspan=3)
 
         tk.Label(frm, text="Format").grid(row=1, column=0, sticky=tk.W)
-        self.format_var = tk.StringVar(value="PNG")
+        self.format_var = tk.StringVar(value="WEBP")
         formats = ["JPEG", "PNG", "TIFF", "BMP", "GIF", "WEBP", "PDF"]
         ttk.Combobox(frm, textvariable=self.format_var, values=formats, state="readonly").grid(row=1, column=1, sticky=tk.W)
 
@@ -54,7 +177,10 @@ class ConverterTool:
         self.gray_var = tk.BooleanVar()
         tk.Checkbutton(frm, text="Grayscale", variable=self.gray_var).grid(row=3, column=2, sticky=tk.W)
 
-        tk.Button(frm, text="Convert", command=self.convert).grid(row=4, column=0, columnspan=4, pady=5)
+        self.convert_button = tk.Button(frm, text="Convert", command=self.convert)
+        self.convert_button.grid(row=4, column=0, columnspan=4, pady=5)
+        self.progress = ttk.Progressbar(frm, mode="determinate")
+        self.progress.grid(row=5, column=0, columnspan=4, sticky=tk.EW)
 
         self.input_path: str | None = None
 
@@ -77,14 +203,34 @@ class ConverterTool:
         dpi = self._parse_int(self.dpi_entry.get())
         grayscale = self.gray_var.get()
 
+        self.convert_button.config(state=tk.DISABLED)
+        self.progress.config(value=0)
+        args = (self.input_path, save_path, out_format, width, height, dpi, grayscale)
+        threading.Thread(target=self._convert_worker, args=args, daemon=True).start()
+
+    def _convert_worker(self, src: str, dst: str, fmt: str, width: int | None, height: int | None, dpi: int | None, gray: bool) -> None:
+        """Run a conversion off the Tk thread and report back through ``after``."""
+        error: Exception | None = None
         try:
-            if self.input_path.lower().endswith(".pdf"):
-                self._convert_pdf(self.input_path, save_path, out_format, width, height, dpi, grayscale)
+            if src.lower().endswith(".pdf"):
+                self._convert_pdf(src, dst, fmt, width, height, dpi, gray, self._report_progress)
             else:
-                self._convert_image(self.input_path, save_path, out_format, width, height, dpi, grayscale)
-            messagebox.showinfo("Done", f"File saved to {save_path}")
+                self._convert_image(src, dst, fmt, width, height, dpi, gray)
         except Exception as exc:  # pylint: disable=broad-except
-            messagebox.showerror("Error", f"Conversion failed: {exc}")
+            error = exc
+        self.window.after(0, self._conversion_done, dst, error)
+
+    def _report_progress(self, done: int, total: int) -> None:
+        # Called from the worker thread; update the bar on the Tk thread.
+        self.window.after(0, lambda: self.progress.config(maximum=total, value=done))
+
+    def _conversion_done(self, dst: str, error: Exception | None) -> None:
+        self.convert_button.config(state=tk.NORMAL)
+        self.progress.config(value=0)
+        if error is None:
+            messagebox.showinfo("Done", f"File saved to {dst}")
+        else:
+            messagebox.showerror("Error", f"Conversion failed: {error}")
 
     # Helpers ---------------------------------------------------------------
     def _parse_int(self, value: str) -> int | None:
@@ -95,28 +241,67 @@ class ConverterTool:
 
     def _convert_image(self, src: str, dst: str, fmt: str, width: int | None, height: int | None, dpi: int | None, gray: bool) -> None:
         img = Image.open(src)
-        img = img.convert("L" if gray else "RGB")
-        if width and height:
-            img = img.resize((width, height))
-        params = {}
-        if dpi:
-            params["dpi"] = (dpi, dpi)
-        img.save(dst, format=fmt, **params)
-
-    def _convert_pdf(self, src: str, dst: str, fmt: str, width: int | None, height: int | None, dpi: int | None, gray: bool) -> None:
-        doc = fitz.open(src)
-        images = []
-        for page in doc:
-            pix = page.get_pixmap(dpi=dpi or 150)
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            if gray:
-                img = img.convert("L")
-            if width and height:
-                img = img.resize((width, height))
-            images.append(img)
-        if fmt in {"TIFF", "GIF", "PDF"}:
-            images[0].save(dst, format=fmt, save_all=True, append_images=images[1:])
+        if width and height and img.format == "JPEG":
+            # Let libjpeg decode at a reduced scale, staying one step above
+            # the target so the final resize still has clean input.
+            img.draft("L" if gray else "RGB", (width * 2, height * 2))
+        size = (width, height) if width and height else None
+        lossless = img.format not in LOSSY_FORMATS
+        _compile_pipeline(fmt, "L" if gray else "RGB", size, dpi, lossless)(img, dst)
+
+    def _convert_pdf(self, src: str, dst: str, fmt: str, width: int | None, height: int | None, dpi: int | None, gray: bool, progress: ProgressCallback | None = None) -> None:
+        with fitz.open(src) as doc:
+            count = len(doc)
+        size = (width, height) if width and height else None
+        workers = _max_workers(count)
+        report = progress or (lambda done, total: None)
+        params = _save_params(fmt)
+        if workers > 1:
+            # The pool is started from a worker thread inside the Tk process;
+            # forking a multi-threaded process can deadlock, so always spawn.
+            executor: Executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
         else:
-            base, ext = os.path.splitext(dst)
-            for i, img in enumerate(images, start=1):
-                img.save(f"{base}_{i}{os.path.splitext(dst)[1]}", format=fmt)
+            executor = _InlineExecutor()
+        with executor:
+            pages = _iter_pages(executor, workers, src, count, dpi or 150, gray, size)
+            if fmt == "PDF":
+                # Each page is handed to MuPDF, which keeps it as a compressed
+                # image, and the PIL image is released straight away. The file
+                # is then written in a single save.
+                with fitz.open() as out:
+                    for done, img in enumerate(pages, start=1):
+                        colorspace = fitz.csGRAY if img.mode == "L" else fitz.csRGB
+                        pix = fitz.Pixmap(colorspace, img.width, img.height, img.tobytes(), False)
+                        img.close()
+                        # One point per pixel, matching Pillow's PDF writer.
+                        page = out.new_page(width=pix.width, height=pix.height)
+                        page.insert_image(page.rect, pixmap=pix)
+                        pix = None
+                        report(done, count)
+                    out.save(dst, garbage=3, deflate=True)
+            elif fmt == "TIFF":
+                # Pages are written one at a time while the workers render
+                # ahead, so only the current page is held in memory.
+                with open(dst, "w+b") as fh, TiffImagePlugin.AppendingTiffWriter(fh) as tiff:
+                    for done, img in enumerate(pages, start=1):
+                        img.save(tiff, format=fmt, **params)
+                        tiff.newFrame()
+                        fh.flush()
+                        img.close()
+                        report(done, count)
+            elif fmt == "GIF":
+                # GIF frames depend on each other, so Pillow needs them all at once.
+                def _reported() -> Iterator[Image.Image]:
+                    for done, img in enumerate(pages, start=1):
+                        report(done, count)
+                        yield img
+
+                frames = _reported()
+                next(frames).save(dst, format=fmt, save_all=True, append_images=frames, **params)
+            else:
+                base, ext = os.path.splitext(dst)
+                targets = [f"{base}_{i}{ext}" for i in range(1, count + 1)]
+                jobs = [executor.submit(_export_page, src, i, target, fmt, dpi or 150, gray, size) for i, target in enumerate(targets)]
+                for done, job in enumerate(jobs, start=1):
+                    job.result()
+                    report(done, count)
@@ -9,27 +9,13 @@ possible. Each tool lives in its own module for modularity and future
 extension.
 """
 
+from __future__ import annotations
+
+import importlib
+import multiprocessing
 from tkinter import Tk, Button, messagebox
 from tkinter import N, S, E, W
 
-try:
-    from pdf_annotator import PDFAnnotator
-except Exception as exc:  # pylint: disable=broad-except
-    PDFAnnotator = None
-    pdf_error = exc
-
-try:
-    from screenshot_tool import ScreenshotTool
-except Exception as exc:  # pylint: disable=broad-except
-    ScreenshotTool = None
-    screenshot_error = exc
-
-try:
-    from converter import ConverterTool
-except Exception as exc:  # pylint: disable=broad-except
-    ConverterTool = None
-    converter_error = exc
-
 
 class Dashboard(Tk):
     """Main dashboard window with tiles arranged in a grid."""
@@ -38,6 +24,14 @@ class Dashboard(Tk):
         super().__init__()
         self.title("Toolbox")
         self.configure(padx=20, pady=20)
+        # Tools are imported on first use so that PyMuPDF and Pillow do not
+        # slow down the dashboard start-up.
+        self._tools = {
+            "pdf_annotator": ("pdf_annotator", "PDFAnnotator", "PDF annotator"),
+            "screenshot": ("screenshot_tool", "ScreenshotTool", "screenshot tool"),
+            "converter": ("converter", "ConverterTool", "converter"),
+        }
+        self._tool_classes: dict[str, type] = {}
         self.create_tiles()
 
     def create_tiles(self) -> None:
@@ -63,24 +57,35 @@ class Dashboard(Tk):
         for j in range(cols):
             self.columnconfigure(j, weight=1)
 
+    def _load_tool(self, key: str) -> type | None:
+        """Import a tool class, showing an error if a dependency is missing."""
+        if key not in self._tool_classes:
+            module_name, class_name, label = self._tools[key]
+            try:
+                module = importlib.import_module(module_name)
+            except Exception as exc:  # pylint: disable=broad-except
+                messagebox.showerror("Missing dependency", f"Cannot open {label}: {exc}")
+                return None
+            self._tool_classes[key] = getattr(module, class_name)
+        return self._tool_classes[key]
+
     def open_pdf_annotator(self) -> None:
-        if PDFAnnotator is None:
-            messagebox.showerror("Missing dependency", f"Cannot open PDF annotator: {pdf_error}")
-            return
-        PDFAnnotator(self)
+        tool = self._load_tool("pdf_annotator")
+        if tool is not None:
+            tool(self)
 
     def open_screenshot(self) -> None:
-        if ScreenshotTool is None:
-            messagebox.showerror("Missing dependency", f"Cannot open screenshot tool: {screenshot_error}")
-            return
-        ScreenshotTool(self)
+        tool = self._load_tool("screenshot")
+        if tool is not None:
+            tool(self)
 
     def open_converter(self) -> None:
-        if ConverterTool is None:
-            messagebox.showerror("Missing dependency", f"Cannot open converter: {converter_error}")
-            return
-        ConverterTool(self)
+        tool = self._load_tool("converter")
+        if tool is not None:
+            tool(self)
 
 
 if __name__ == "__main__":
+    # Required for the converter's worker processes in the PyInstaller build.
+    multiprocessing.freeze_support()
     Dashboard().mainloop()
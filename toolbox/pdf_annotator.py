@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import io
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from typing import Dict, List, Tuple
 
@@ -15,6 +20,13 @@ except Exception as exc:  # pylint: disable=broad-except
         "PyMuPDF is required for the PDF annotator. Please install it before running."  # noqa: E501
     ) from exc
 
+try:
+    import numpy as np
+except Exception as exc:  # pylint: disable=broad-except
+    raise ImportError(
+        "NumPy is required for the PDF annotator. Please install it before running."  # noqa: E501
+    ) from exc
+
 try:
     from PIL import Image, ImageTk
 except Exception as exc:  # pylint: disable=broad-except
@@ -22,12 +34,51 @@ except Exception as exc:  # pylint: disable=broad-except
         "Pillow is required for the PDF annotator. Please install it before running."  # noqa: E501
     ) from exc
 
+# Number of rendered pages kept around for quick page flips, and how far
+# from the current page a cached page may be before it is dropped.
+PAGE_CACHE_SIZE = 10
+PAGE_CACHE_WINDOW = 5
+ZOOM = 1.5
+# How often the Tk loop checks whether a page render has finished.
+RENDER_POLL_MS = 20
+
+# State of a render process: the document it has open and the display lists
+# of recently rendered pages, so a page is only parsed once per process.
+_render_key: Tuple[str, float] | None = None
+_render_doc: fitz.Document | None = None
+_render_displaylists: OrderedDict[int, fitz.DisplayList] = OrderedDict()
+
+
+def _render_page(path: str, page_num: int) -> Image.Image:
+    """Rasterize a page of ``path``.
+
+    Runs in a render process: PyMuPDF holds the GIL while rasterizing, so a
+    thread would still stall the Tk loop. Module level so it can be pickled.
+    """
+    global _render_key, _render_doc  # pylint: disable=global-statement
+    key = (path, os.path.getmtime(path))
+    if key != _render_key:
+        _render_doc = fitz.open(path)
+        _render_key = key
+        _render_displaylists.clear()
+    dl = _render_displaylists.get(page_num)
+    if dl is None:
+        dl = _render_doc[page_num].get_displaylist()
+        _render_displaylists[page_num] = dl
+        if len(_render_displaylists) > PAGE_CACHE_SIZE:
+            _render_displaylists.popitem(last=False)
+    else:
+        _render_displaylists.move_to_end(page_num)
+    pix = dl.get_pixmap(matrix=fitz.Matrix(ZOOM, ZOOM), alpha=False)
+    # Pillow cannot map "RGB" buffers, so this is a copy either way.
+    return Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+
 
 @dataclass
 class PageAnnotations:
     """Keep track of strokes and texts for a page."""
 
-    strokes: List[List[Tuple[int, int]]] = field(default_factory=list)
+    strokes: List[np.ndarray] = field(default_factory=list)  # (n, 2) int32 points
     texts: List[Tuple[int, int, str]] = field(default_factory=list)
 
 
@@ -54,14 +105,24 @@ class PDFAnnotator:
 
         self.doc: fitz.Document | None = None
         self.current_page = 0
-        self.page_images: Dict[int, ImageTk.PhotoImage] = {}
+        self.page_images: OrderedDict[int, ImageTk.PhotoImage] = OrderedDict()
+        # Renders in flight or finished but not shown yet, by page number.
+        self._pending: Dict[int, Future[Image.Image]] = {}
+        self._pool: ProcessPoolExecutor | None = None
         self.annotations: Dict[int, PageAnnotations] = {}
         self.mode = "draw"
         self.current_line: int | None = None
+        self._current_pts: List[int] = []
 
         self.canvas.bind("<ButtonPress-1>", self.on_press)
         self.canvas.bind("<B1-Motion>", self.on_drag)
         self.canvas.bind("<ButtonRelease-1>", self.on_release)
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self.window.destroy()
 
     # PDF handling ---------------------------------------------------------
     def open_pdf(self) -> None:
@@ -72,6 +133,10 @@ class PDFAnnotator:
             self.doc = fitz.open(path)
             self.current_page = 0
             self.annotations.clear()
+            self.page_images.clear()
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
             self.display_page()
         except Exception as exc:  # pylint: disable=broad-except
             messagebox.showerror("Error", f"Failed to open PDF: {exc}")
@@ -79,15 +144,79 @@ class PDFAnnotator:
     def display_page(self) -> None:
         if not self.doc:
             return
-        page = self.doc[self.current_page]
-        zoom = 1.5
-        pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom))
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-        self.page_images[self.current_page] = ImageTk.PhotoImage(img)
+        photo = self.page_images.get(self.current_page)
+        if photo is not None:
+            self.page_images.move_to_end(self.current_page)
+            self._show_photo(photo)
+            return
+        future = self._pending.get(self.current_page)
+        if future is None:
+            future = self._submit_render(self.current_page)
+        if not future.done():
+            # Blank the canvas until the page arrives from the render process.
+            self.canvas.delete("all")
+        self._poll_render(future, self.doc, self.current_page)
+
+    def _submit_render(self, page_num: int) -> Future[Image.Image]:
+        future = self._render_pool().submit(_render_page, self.doc.name, page_num)
+        self._pending[page_num] = future
+        return future
+
+    def _render_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # Spawn rather than fork: this process runs Tk and other threads.
+            self._pool = ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn"))
+        return self._pool
+
+    def _poll_render(self, future: Future[Image.Image], doc: fitz.Document, page_num: int) -> None:
+        """Wait for ``future`` without blocking the Tk loop, then show the page."""
+        if not future.done():
+            self.window.after(RENDER_POLL_MS, self._poll_render, future, doc, page_num)
+            return
+        if self._pending.get(page_num) is future:
+            del self._pending[page_num]
+        if doc is not self.doc or future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            if page_num == self.current_page:
+                messagebox.showerror("Error", f"Failed to render page: {error}")
+            return
+        # ImageTk.PhotoImage must be created on the Tk thread.
+        photo = self._cache_photo(page_num, future.result())
+        if page_num == self.current_page:
+            self._show_photo(photo)
+
+    def _cache_photo(self, page_num: int, img: Image.Image) -> ImageTk.PhotoImage:
+        photo = ImageTk.PhotoImage(img)
+        self.page_images[page_num] = photo
+        for cached in [p for p in self.page_images if abs(p - self.current_page) > PAGE_CACHE_WINDOW]:
+            del self.page_images[cached]
+        if len(self.page_images) > PAGE_CACHE_SIZE:
+            self.page_images.popitem(last=False)
+        return photo
+
+    def _show_photo(self, photo: ImageTk.PhotoImage) -> None:
         self.canvas.delete("all")
-        self.canvas.create_image(0, 0, anchor=tk.NW, image=self.page_images[self.current_page])
+        self.canvas.create_image(0, 0, anchor=tk.NW, image=photo)
         self.canvas.config(scrollregion=self.canvas.bbox(tk.ALL))
         self.redraw_annotations()
+        self._prefetch_neighbours()
+
+    def _prefetch_neighbours(self) -> None:
+        """Queue the previous and next page in the render processes.
+
+        Finished renders stay in their future until the page is shown; a
+        render that failed is reported then, like any other page.
+        """
+        if not self.doc:
+            return
+        wanted = {p for p in (self.current_page - 1, self.current_page, self.current_page + 1) if 0 <= p < len(self.doc)}
+        for page_num in [p for p in self._pending if p not in wanted]:
+            self._pending.pop(page_num).cancel()
+        for page_num in sorted(wanted):
+            if page_num not in self.page_images and page_num not in self._pending:
+                self._submit_render(page_num)
 
     def prev_page(self) -> None:
         if not self.doc:
@@ -109,7 +238,8 @@ class PDFAnnotator:
 
     def on_press(self, event: tk.Event) -> None:  # type: ignore[override]
         if self.mode == "draw":
-            self.current_line = self.canvas.create_line(event.x, event.y, event.x, event.y, fill="red", width=2)
+            self._current_pts = [event.x, event.y, event.x, event.y]
+            self.current_line = self.canvas.create_line(*self._current_pts, fill="red", width=2)
         elif self.mode == "text":
             text = simpledialog.askstring("Text", "Enter text")
             if text:
@@ -119,24 +249,25 @@ class PDFAnnotator:
 
     def on_drag(self, event: tk.Event) -> None:  # type: ignore[override]
         if self.mode == "draw" and self.current_line is not None:
-            coords = self.canvas.coords(self.current_line) + [event.x, event.y]
-            self.canvas.coords(self.current_line, *coords)
+            # Track the points ourselves rather than reading the whole stroke
+            # back from Tk on every motion event.
+            self._current_pts.extend((event.x, event.y))
+            self.canvas.coords(self.current_line, *self._current_pts)
 
     def on_release(self, _event: tk.Event) -> None:  # type: ignore[override]
         if self.mode == "draw" and self.current_line is not None:
-            coords = self.canvas.coords(self.current_line)
-            points = [(int(coords[i]), int(coords[i + 1])) for i in range(0, len(coords), 2)]
+            points = np.asarray(self._current_pts, dtype=np.int32).reshape(-1, 2)
             page_ann = self.annotations.setdefault(self.current_page, PageAnnotations())
             page_ann.strokes.append(points)
             self.current_line = None
+            self._current_pts = []
 
     def redraw_annotations(self) -> None:
         page_ann = self.annotations.get(self.current_page)
         if not page_ann:
             return
         for stroke in page_ann.strokes:
-            flat = [v for point in stroke for v in point]
-            self.canvas.create_line(*flat, fill="red", width=2)
+            self.canvas.create_line(*stroke.ravel().tolist(), fill="red", width=2)
         for x, y, text in page_ann.texts:
             self.canvas.create_text(x, y, text=text, fill="blue", anchor=tk.NW)
 
@@ -147,17 +278,27 @@ class PDFAnnotator:
         save_path = filedialog.asksaveasfilename(defaultextension=".pdf", filetypes=[("PDF", "*.pdf")])
         if not save_path:
             return
+        if os.path.exists(save_path) and os.path.samefile(save_path, self.doc.name):
+            # Checked before anything is burned in, so a rejected save leaves
+            # the open document untouched.
+            messagebox.showerror("Error", "Failed to save: cannot overwrite the PDF that is currently open")
+            return
         try:
             for page_num, ann in self.annotations.items():
                 page = self.doc[page_num]
                 shape = page.new_shape()
                 for stroke in ann.strokes:
-                    pdf_points = [fitz.Point(x, y) for x, y in stroke]
-                    shape.draw_polyline(pdf_points, color=(1, 0, 0), width=2)
+                    shape.draw_polyline(stroke.tolist())
+                    shape.finish(color=(1, 0, 0), width=2)
                 for x, y, text in ann.texts:
                     page.insert_text((x, y), text, fontsize=12, color=(0, 0, 1))
                 shape.commit()
-            self.doc.save(save_path)
+            # Serialize in memory and write it out in one go; many small writes
+            # are slow on network shares.
+            buf = io.BytesIO()
+            self.doc.save(buf, garbage=4, deflate=True, clean=True)
+            with open(save_path, "wb", buffering=1 << 20) as fh:
+                fh.write(buf.getbuffer())
             messagebox.showinfo("Saved", f"Annotations saved to {save_path}")
         except Exception as exc:  # pylint: disable=broad-except
             messagebox.showerror("Error", f"Failed to save: {exc}")
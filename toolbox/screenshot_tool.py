@@ -1,15 +1,31 @@
 """Screenshot utility using Tkinter and Pillow."""
 
+import os
 import tkinter as tk
 from tkinter import filedialog, messagebox
 
 try:
-    from PIL import ImageGrab
+    from PIL import Image, ImageGrab, ImageTk
 except Exception as exc:  # pylint: disable=broad-except
     raise ImportError(
         "Pillow is required for the screenshot tool. Please install it before running."  # noqa: E501
     ) from exc
 
+FILETYPES = [("WebP", "*.webp"), ("PNG", "*.png"), ("JPEG", "*.jpg")]
+
+# Encoder options by file extension, tuned for fast saves of screen content.
+SAVE_PARAMS = {
+    ".webp": {"lossless": True, "method": 6},
+    ".png": {"compress_level": 1},
+    ".jpg": {"quality": 85, "optimize": True, "progressive": True},
+    ".jpeg": {"quality": 85, "optimize": True, "progressive": True},
+}
+
+
+def _save(img: Image.Image, path: str) -> None:
+    """Save a capture with encoder options suited to its format."""
+    img.save(path, **SAVE_PARAMS.get(os.path.splitext(path)[1].lower(), {}))
+
 
 class ScreenshotTool:
     """Window that provides full screen and region screenshot capabilities."""
@@ -22,44 +38,53 @@ class ScreenshotTool:
         tk.Button(self.window, text="Region", command=self.region).pack(fill=tk.X)
 
     def full_screen(self) -> None:
-        path = filedialog.asksaveasfilename(defaultextension=".png", filetypes=[("PNG", "*.png"), ("JPEG", "*.jpg")])
+        path = filedialog.asksaveasfilename(defaultextension=".webp", filetypes=FILETYPES)
         if not path:
             return
         try:
             img = ImageGrab.grab()
-            img.save(path)
+            _save(img, path)
             messagebox.showinfo("Saved", f"Screenshot saved to {path}")
         except Exception as exc:  # pylint: disable=broad-except
             messagebox.showerror("Error", f"Failed to capture screenshot: {exc}")
 
     def region(self) -> None:
-        selector = _RegionSelector(self.master)
+        try:
+            selector = _RegionSelector(self.master)
+        except Exception as exc:  # pylint: disable=broad-except
+            messagebox.showerror("Error", f"Failed to capture screenshot: {exc}")
+            return
         self.master.wait_window(selector.top)
         if selector.bbox:
-            path = filedialog.asksaveasfilename(defaultextension=".png", filetypes=[("PNG", "*.png"), ("JPEG", "*.jpg")])
+            path = filedialog.asksaveasfilename(defaultextension=".webp", filetypes=FILETYPES)
             if not path:
                 return
             try:
-                img = ImageGrab.grab(bbox=selector.bbox)
-                img.save(path)
+                img = selector.background.crop(selector.bbox)
+                _save(img, path)
                 messagebox.showinfo("Saved", f"Screenshot saved to {path}")
             except Exception as exc:  # pylint: disable=broad-except
                 messagebox.showerror("Error", f"Failed to capture screenshot: {exc}")
 
 
 class _RegionSelector:
-    """Transparent fullscreen window to select a region."""
+    """Fullscreen window showing a frozen capture of the screen to select a region.
+
+    The screen is grabbed once when the selector opens; the chosen region is
+    cropped from that capture instead of grabbing the screen a second time.
+    """
 
     def __init__(self, master: tk.Misc) -> None:
+        self.background = ImageGrab.grab()
         self.top = tk.Toplevel(master)
         self.top.attributes("-fullscreen", True)
-        self.top.attributes("-alpha", 0.3)
-        self.top.configure(bg="gray")
         self.start_x = self.start_y = 0
         self.bbox = None
 
-        self.canvas = tk.Canvas(self.top, cursor="cross")
+        self.canvas = tk.Canvas(self.top, cursor="cross", highlightthickness=0)
         self.canvas.pack(fill=tk.BOTH, expand=True)
+        self._photo = ImageTk.PhotoImage(self.background)
+        self.canvas.create_image(0, 0, anchor=tk.NW, image=self._photo)
         self.rect = None
 
         self.canvas.bind("<ButtonPress-1>", self.on_press)